@@ -6,14 +6,66 @@ Run with -h or --help to see all options, i.e.:
 
     python main.py -h
 """
-import argparse
-from typing import Optional, Literal
+import os
+import re
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional, Literal
+
+if TYPE_CHECKING:
+    import argparse
+
+__version__ = '1.0.0'
+
+# The `--mode` choices. `sys.intern` makes sure there is only one copy of each
+# string, and the parser interns the user's value too (`type=sys.intern`), so
+# code using the result can compare with `pargs.mode is _AUTO`, which checks
+# identity instead of comparing the strings character by character.
+_AUTO = sys.intern('auto')
+_MANUAL = sys.intern('manual')
+
+# argparse accepts any container for `choices`. A dict checks `value in _MODES`
+# with one hash lookup however many choices there are, while still listing
+# them in this order in `--help` and error messages (a set wouldn't).
+_MODES = dict.fromkeys((_AUTO, _MANUAL))
+
+# Default values for the optional arguments, in one place. `build_parser`
+# passes them to `add_argument` (so `--help` shows them), and `fast_parse`
+# starts from them too, so the two ways of parsing can't disagree.
+_DEFAULTS: dict[str, Any] = {
+    'optional_destination': 'default_value',
+    'files': [],
+    'required_files': None,
+    'verbose': False,
+    'mode': _AUTO,
+    'size': '1MB',  # Converted by `parse_size`, like a value typed by the user
+}
 
 
 # This is the data structure that our information parsed from
 # the command line will follow. This gives us autocomplete in
 # IDEs and text editors.
 class FileProcessorNamespace:
+    # `__slots__` gives each attribute a fixed place in the object instead of
+    # an entry in a per-object `__dict__`, which makes the objects smaller and
+    # attribute access faster. The catch: argparse can only store results
+    # under names listed here, so every `dest` of an `add_argument` call in
+    # `build_parser` (and every attribute in the `_FAST_*` tables) must be
+    # added to `__slots__`, or parsing stops with an AttributeError. Add a
+    # matching annotation below too, so your editor knows the type.
+    # Default values can't go on the class as well (`verbose: bool = False`):
+    # Python refuses class values for names in `__slots__`. They live in
+    # `_DEFAULTS` above, which both `build_parser` and `fast_parse` use.
+    __slots__ = (
+        'source',
+        'optional_destination',
+        'files',
+        'required_files',
+        'verbose',
+        'mode',
+        'size',
+    )
+
     source: str
     optional_destination: Optional[str]
     files: Optional[list[str]]
@@ -23,7 +75,19 @@ class FileProcessorNamespace:
     size: int
 
 
-def setup_parser() -> type[FileProcessorNamespace]:
+# The fields to show the user, worked out once when the program starts.
+# Names starting with `_` are left out, so you can add private helper fields.
+_PUBLIC_FIELDS: tuple[str, ...] = tuple(
+    k for k in FileProcessorNamespace.__slots__ if not k.startswith('_')
+)
+
+
+def build_parser() -> 'argparse.ArgumentParser':
+    # argparse is imported here rather than at the top of the file so that
+    # runs which never build a parser (such as `--version`, see `main()`)
+    # don't pay for importing it.
+    import argparse
+
     # `__doc__` refers to the multi-line comment at the top of this file.
     parser = argparse.ArgumentParser(
         description=__doc__,
@@ -38,6 +102,13 @@ def setup_parser() -> type[FileProcessorNamespace]:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
+    # Every `add_argument` call asks the parser for a brand new help formatter
+    # just to double-check the argument's metavar, which doesn't change the
+    # formatter. Handing out one shared formatter while we add arguments saves
+    # building (and, on Python 3.14+, color-detecting) a new one each time.
+    formatter = parser._get_formatter()
+    parser._get_formatter = lambda: formatter
+
 
 
     ### Required positional argument
@@ -62,7 +133,7 @@ def setup_parser() -> type[FileProcessorNamespace]:
     parser.add_argument(
         'optional_destination',
         nargs='?',  # Makes argument optional; '?' means "zero or one"
-        default='default_value',
+        default=_DEFAULTS['optional_destination'],  # 'default_value'
         help='Optional positional argument with default (default: %(default)s).',
     )
 
@@ -96,15 +167,18 @@ def setup_parser() -> type[FileProcessorNamespace]:
         '--files',
         nargs='*',
 
-        # no default set
+        # Defaults are set in `_DEFAULTS` at the top of this file rather than
+        # written here, so that `fast_parse` uses the same ones.
+
+        # 'files': None  (or leave `default` out here and in `_DEFAULTS`)
         # python main.py my_source_directory
         # pargs.files None
 
-        default=[],
+        default=_DEFAULTS['files'],  # []
         # python main.py my_source_directory
         # pargs.files []
 
-        # default=['a', 'b', 'c'],
+        # 'files': ['a', 'b', 'c']
         # python main.py my_source_directory
         # pargs.files ['a', 'b', 'c']
 
@@ -123,6 +197,7 @@ def setup_parser() -> type[FileProcessorNamespace]:
     parser.add_argument(
         '--required-files',
         nargs='+',
+        default=_DEFAULTS['required_files'],  # None, which is also argparse's default
         help='One or more arguments (default: %(default)s)',
     )
     # `nargs='+'` means "one or more", and the result will be a list that
@@ -144,6 +219,7 @@ def setup_parser() -> type[FileProcessorNamespace]:
         '-v',
         '--verbose',
         action='store_true',
+        default=_DEFAULTS['verbose'],  # False, which is also argparse's default
         help='Flag argument (default: %(default)s)',
     )
 
@@ -156,14 +232,23 @@ def setup_parser() -> type[FileProcessorNamespace]:
     # python main.py my_source_directory --verbose
     # pargs.verbose True
 
+    # argparse stores every option string ('-v' and '--verbose' alike) as a
+    # key in a dictionary pointing at its action, so finding an option takes
+    # the same time no matter how many options the parser has.
+    # `fast_parse` (below) keeps its own copy of these option strings, in the
+    # `_FAST_*` tables, not to make lookups faster but so that simple command
+    # lines can skip importing argparse and building this parser altogether.
+    # Keep the two in sync when you add or change an option.
+
 
 
     ### Choice from predefined options
     parser.add_argument(
         '-m',
         '--mode',
-        choices=['auto', 'manual'],
-        default='auto',
+        choices=_MODES,
+        type=sys.intern,  # Applied before checking `choices`
+        default=_DEFAULTS['mode'],  # _AUTO
         help='Choice argument (default: %(default)s)',
     )
 
@@ -172,6 +257,7 @@ def setup_parser() -> type[FileProcessorNamespace]:
 
     # python main.py my_source_directory --mode manual
     # pargs.mode 'manual'
+    # pargs.mode is _MANUAL  ->  True
 
 
 
@@ -182,7 +268,7 @@ def setup_parser() -> type[FileProcessorNamespace]:
         '-s',
         '--size',
         type=parse_size,  # see the definition of parse_size below
-        default='1MB',
+        default=_DEFAULTS['size'],  # '1MB'
         help='Size argument (e.g., 500KB, 1.5MB) (default: %(default)s)',
     )
 
@@ -199,10 +285,34 @@ def setup_parser() -> type[FileProcessorNamespace]:
     # pargs.size 512000
 
 
-    # `namespace=FileProcessorNamespace` tells our linter and IDE the data and data types
+
+    ### Version information
+    parser.add_argument(
+        '--version',
+        action='version',  # Prints `version` and exits
+        version=f'%(prog)s {__version__}',
+    )
+
+    # python main.py --version
+    # main.py 1.0.0
+
+
+    # Printing help or usage fills the formatter with text, so go back to
+    # getting a fresh one per call now that all arguments have been added.
+    del parser._get_formatter
+
+    return parser
+
+
+def setup_parser() -> FileProcessorNamespace:
+    parser = build_parser()
+
+    # `namespace=FileProcessorNamespace()` tells our linter and IDE the data and data types
     # that the result will contain; for example, we can type `pargs.req` and then hit
-    # tab-tab and it will autocomplete `pargs.required_files`
-    pargs = parser.parse_args(namespace=FileProcessorNamespace)
+    # tab-tab and it will autocomplete `pargs.required_files`.
+    # Note the `()`: argparse stores the results on a new object each time, rather
+    # than on the class itself, where they would stick around between calls.
+    pargs = parser.parse_args(namespace=FileProcessorNamespace())
 
     return pargs
 
@@ -213,18 +323,261 @@ def setup_parser() -> type[FileProcessorNamespace]:
 ## given path exists), and even optionally transform the value into something else.
 ## For example, we could make it convert a string file/directory path into an
 ## actual python pathlib.Path object.
+_SIZE_RE: re.Pattern[str] = re.compile(r'\s*(\d+(?:\.\d*)?|\.\d+)\s*([KMGTkmgt]?)[Bb]\s*')
+
+# Each unit is a power of 1024, so whole numbers can be converted by shifting.
+# Keyed by the unit's first letter in both cases, so that '5mb', '5Mb' and
+# '5MB' are each a single lookup without converting the string to uppercase.
+_SHIFTS: dict[str, int] = {
+    '': 0,
+    'K': 10, 'k': 10,
+    'M': 20, 'm': 20,
+    'G': 30, 'g': 30,
+    'T': 40, 't': 40,
+}
+
+
+# `lru_cache` remembers results, so parsing the same string twice is free.
+@lru_cache(maxsize=128)
 def parse_size(size_str: str) -> int:
     """Convert strings such as '5MB' or '10GB' to number of bytes"""
-    units: dict[str, int] = {'B': 1, 'KB': 1024, 'MB': 1024*1024, 'GB': 1024*1024*1024}
-    size: float = float(size_str[:-2].strip())
-    unit = size_str[-2:].upper()
-    return int(size * units[unit])
+    match = _SIZE_RE.fullmatch(size_str)
+    if match is None:
+        # argparse turns a ValueError into a friendly "invalid value" error.
+        raise ValueError(f"Invalid size: '{size_str}'")
+
+    number, prefix = match.groups()
+    shift = _SHIFTS[prefix]
+    if '.' not in number:
+        return int(number) << shift
+    try:
+        return int(float(number) * (1 << shift))
+    except OverflowError:
+        # Too big for a float. argparse only reports ValueError nicely.
+        raise ValueError(f"Size too large: '{size_str}'")
+
+
+# Converts and checks `-m`/`--mode` values for `_FAST_VALUE_OPTIONS` below.
+def check_mode(mode: str) -> str:
+    """Only accept the `--mode` choices offered in `build_parser`"""
+    mode = sys.intern(mode)
+    if mode not in _MODES:
+        raise ValueError(f"Invalid mode: '{mode}'")
+    return mode
+
+
+# The options `fast_parse` understands, one table per kind of option.
+
+# Flags: option string -> attribute that becomes True
+_FAST_FLAGS: dict[str, str] = {
+    '-v': 'verbose',
+    '--verbose': 'verbose',
+}
+
+# Options taking one value: option string -> (attribute, value conversion)
+_FAST_VALUE_OPTIONS: dict[str, tuple[str, Callable[[str], object]]] = {
+    '-m': ('mode', check_mode),
+    '--mode': ('mode', check_mode),
+    '-s': ('size', parse_size),
+    '--size': ('size', parse_size),
+}
+
+# Options taking a list of values: option string -> (attribute, whether at
+# least one value is needed, i.e. `nargs='+'` rather than `nargs='*'`)
+_FAST_LIST_OPTIONS: dict[str, tuple[str, bool]] = {
+    '--files': ('files', False),
+    '--required-files': ('required_files', True),
+}
+
+
+## argparse is thorough, but importing it and building the parser costs more
+## than parsing a short command line by hand. `fast_parse` handles the common,
+## unambiguous cases itself, and gives up (returns None) on anything else:
+## unknown or abbreviated options, `--opt=value`, bad values, missing
+## arguments, and so on. argparse then parses the command line as usual and
+## prints its usual error messages. If you add or change an argument in
+## `build_parser`, update the `_FAST_*` tables too (defaults come from
+## `_DEFAULTS`).
+def fast_parse(argv: list[str]) -> Optional[FileProcessorNamespace]:
+    """Parse simple command lines without argparse, or return None to let argparse do it"""
+    pargs = FileProcessorNamespace()
+    pargs.optional_destination = _DEFAULTS['optional_destination']
+    pargs.files = _DEFAULTS['files']
+    pargs.required_files = _DEFAULTS['required_files']
+    pargs.verbose = _DEFAULTS['verbose']
+    pargs.mode = _DEFAULTS['mode']
+    pargs.size = parse_size(_DEFAULTS['size'])
+
+    positionals: list[str] = []
+    # argparse reads positionals as one group: in `main.py src -v dest`,
+    # `dest` is an error rather than the destination. Leave such split-up
+    # positionals to argparse.
+    positionals_done = False
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if not arg.startswith('-'):
+            if positionals_done:
+                return None
+            positionals.append(arg)
+            continue
+
+        if positionals:
+            positionals_done = True
+
+        if arg in _FAST_FLAGS:
+            setattr(pargs, _FAST_FLAGS[arg], True)
+
+        elif arg in _FAST_VALUE_OPTIONS:
+            dest, convert = _FAST_VALUE_OPTIONS[arg]
+            if i == len(argv) or argv[i].startswith('-'):
+                return None
+            try:
+                setattr(pargs, dest, convert(argv[i]))
+            except ValueError:
+                return None
+            i += 1
+
+        elif arg in _FAST_LIST_OPTIONS:
+            dest, needs_value = _FAST_LIST_OPTIONS[arg]
+            values: list[str] = []
+            while i < len(argv) and not argv[i].startswith('-'):
+                values.append(argv[i])
+                i += 1
+            if needs_value and not values:
+                return None
+            setattr(pargs, dest, values)
+
+        else:
+            return None
+
+    if len(positionals) == 2:
+        pargs.source, pargs.optional_destination = positionals
+    elif len(positionals) == 1:
+        pargs.source = positionals[0]
+    else:
+        return None
+
+    return pargs
+
+
+def terminal_columns() -> int:
+    """Terminal width, worked out the same way argparse does it (via shutil)"""
+    try:
+        columns = int(os.environ['COLUMNS'])
+    except (KeyError, ValueError):
+        columns = 0
+
+    if columns <= 0:
+        try:
+            columns = os.get_terminal_size(sys.__stdout__.fileno()).columns
+        except (AttributeError, ValueError, OSError):
+            columns = 0
+
+    return columns or 80
+
+
+def help_cache_dir() -> str:
+    """Directory for the saved help text: where Python keeps this file's .pyc"""
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    if sys.pycache_prefix is None:
+        return os.path.join(source_dir, '__pycache__')
+
+    # With a pycache prefix (`python -X pycache_prefix=...`), Python mirrors
+    # the source directory's full path under the prefix instead.
+    source_dir = os.path.splitdrive(source_dir)[1].lstrip(os.sep + (os.altsep or ''))
+    return os.path.join(sys.pycache_prefix, source_dir)
+
+
+def print_help_cached() -> None:
+    """Print the `--help` text, reusing a copy saved by an earlier run if possible"""
+    # Besides this file, the help text depends on the program name, the Python
+    # version (argparse's layout changes between versions) and the terminal:
+    # its width, and on Python 3.14+ whether it gets colors, which is decided
+    # by isatty and a few environment variables. All of these go into a
+    # checksum in the cache file's name, and the cached copy is thrown away
+    # whenever this file is newer than it.
+    import zlib
+
+    prog = os.path.basename(sys.argv[0])
+    key = repr((
+        prog,
+        sys.hexversion,
+        terminal_columns(),
+        sys.stdout.isatty(),
+        [os.environ.get(name) for name in ('NO_COLOR', 'FORCE_COLOR', 'PYTHON_COLORS', 'TERM')],
+    ))
+    cache_name = f'{prog}.{zlib.crc32(key.encode()):08x}.help.txt'
+    cache_path = os.path.join(help_cache_dir(), cache_name)
+
+    try:
+        if os.stat(cache_path).st_mtime >= os.stat(__file__).st_mtime:
+            with open(cache_path, encoding='utf-8') as f:
+                sys.stdout.write(f.read())
+            return
+    except OSError:
+        pass
+
+    help_text = build_parser().format_help()
+    sys.stdout.write(help_text)
+
+    # Like Python's own .pyc files, don't save anything when asked not to
+    # (`python -B` or PYTHONDONTWRITEBYTECODE).
+    if sys.dont_write_bytecode:
+        return
+
+    # Saving the copy is best-effort: if the directory isn't writable, we just
+    # rebuild the help text next time. Writing to a temporary file and renaming
+    # it means another run never reads a half-written copy.
+    cache_dir = os.path.dirname(cache_path)
+    tmp_path = f'{cache_path}.{os.getpid()}'
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(help_text)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+
+    # Only keep the newest copy, so that copies for other terminal widths or
+    # settings don't pile up.
+    try:
+        for name in os.listdir(cache_dir):
+            if name.startswith(f'{prog}.') and name.endswith('.help.txt') and name != cache_name:
+                os.remove(os.path.join(cache_dir, name))
+    except OSError:
+        pass
 
 
 def main():
+    # Short-circuit `python main.py --version` before building the parser.
+    # This prints the same text as the `--version` argument above, without
+    # importing argparse or constructing any of its objects.
+    if sys.argv[1:] == ['--version']:
+        print(f'{os.path.basename(sys.argv[0])} {__version__}')
+        return
+
+    # Running with no arguments at all isn't short-circuited: `source` is
+    # required, so that case has to print argparse's usage and error message.
+
+    # Likewise, `python main.py -h` prints help text saved by an earlier run
+    # instead of building the parser just to generate the same text again.
+    if sys.argv[1:] in (['-h'], ['--help']):
+        print_help_cached()
+        return
+
     # This is named `pargs` instead of `args` because `args` tends
     # to be a reserved word, for example in command-line debuggers.
-    pargs: type[FileProcessorNamespace] = setup_parser()
+    pargs: Optional[FileProcessorNamespace] = fast_parse(sys.argv[1:])
+    if pargs is None:
+        pargs = setup_parser()
 
     # Now that we have received the arguments from the user, we can
     # start doing our program logic.
@@ -232,17 +585,17 @@ def main():
     # Normally we'd access arguments directly such as `pargs.source`, but
     # this allows us to iterate through all of the arguments dynamically,
     # even if new ones are added.
-    from pprint import pprint
-    pprint({k: v for k, v in pargs.__dict__.items() if not k.startswith('_')})
+    # The lines are joined into one string so that they are written in one go.
+    sys.stdout.write(''.join(f'{k}: {getattr(pargs, k)!r}\n' for k in _PUBLIC_FIELDS))
 
     # python main.py . some_destination --files main.py validators.py --mode manual -v
-    # {'files': ['main.py', 'validators.py'],
-    #  'mode': 'manual',
-    #  'optional_destination': 'some_destination',
-    #  'required_files': None,
-    #  'size': 1048576,
-    #  'source': '.',
-    #  'verbose': True}
+    # source: '.'
+    # optional_destination: 'some_destination'
+    # files: ['main.py', 'validators.py']
+    # required_files: None
+    # verbose: True
+    # mode: 'manual'
+    # size: 1048576
 
 if __name__ == '__main__':
     main()
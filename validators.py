@@ -4,38 +4,58 @@ Template demonstrating various argparse features.
 
 Run with -h or --help to see all options.
 """
-import argparse
 import os
-import pathlib
-
-
-def file(path: str) -> pathlib.Path:
-    if not os.path.exists(path):
+import stat
+from functools import lru_cache
+
+
+# `lru_cache` remembers the result for each path, so a path that appears
+# several times on the command line is only checked on disk once.
+@lru_cache(maxsize=4096)
+def file(path: str) -> str:
+    # A single `os.stat` call tells us both whether the path exists and what
+    # kind of thing it is, where `os.path.exists` + `os.path.isfile` would
+    # ask the operating system twice.
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
         raise ValueError(f"Expected file, doesn't exist: '{path}'")
 
-    if not os.path.isfile(path):
+    if not stat.S_ISREG(mode):
         raise ValueError(f"Expected file, received non-file: '{path}'")
 
-    # We could also just return the string as-is.
-    return pathlib.Path(path)
+    # We could also return `pathlib.Path(path)` here, but building a Path
+    # object (and importing pathlib) costs more than the check above. The
+    # string is enough for `open()` and the `os` functions; code that wants
+    # Path methods can call `pathlib.Path(path)` itself.
+    return path
 
 
-def directory(path: str) -> pathlib.Path:
-    if not os.path.exists(path):
+@lru_cache(maxsize=4096)
+def directory(path: str) -> str:
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
         raise ValueError(f"Expected directory, doesn't exist: '{path}'")
 
-    if not os.path.isdir(path):
+    if not stat.S_ISDIR(mode):
         raise ValueError(f"Expected directory, received non-directory: '{path}'")
 
-    return pathlib.Path(path)
+    return path
 
 
 def setup_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=__doc__,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
+    # Share one help formatter while adding arguments; see main.py.
+    formatter = parser._get_formatter()
+    parser._get_formatter = lambda: formatter
+
 
 
     ### Required positional argument
@@ -71,13 +91,21 @@ def setup_parser():
     # error: argument files: invalid file value: 'nonexistent.txt'
 
     # python validators.py my_source_directory main.py validators.py
-    # pargs.files [PosixPath('main.py'), PosixPath('validators.py')]
+    # pargs.files ['main.py', 'validators.py']
 
-    # `PosixPath` represents file paths on Unix-like systems (Linux, MacOS, etc) 
-    # and Windows. It handles path structures such as "/home/user/docs"
-    # and "C:\Users\name\Downloads" in a consistent way across operating systems.
+    del parser._get_formatter
 
     pargs = parser.parse_args()
+
+    # Drop repeated files, keeping the first of each in order, so the program
+    # only processes each file once. (Thanks to `lru_cache` on `file`, the
+    # repeats were only checked on disk once as well.)
+    # `dict.fromkeys` keeps the order in which keys were first seen.
+    pargs.files = list(dict.fromkeys(pargs.files))
+
+    # python validators.py . main.py main.py validators.py
+    # pargs.files ['main.py', 'validators.py']
+
     return pargs
 
 
@@ -86,7 +114,7 @@ def main():
 
     print(f"Received arguments: {vars(pargs)}")
     # python validators.py . main.py 
-    # Received arguments: {'source_directory': PosixPath('.'), 'files': [PosixPath('main.py')]}
+    # Received arguments: {'source_directory': '.', 'files': ['main.py']}
 
 
 if __name__ == '__main__':